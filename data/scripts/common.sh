@@ -30,6 +30,18 @@ execute_sql() {
         sh -c 'PGPASSWORD=$POSTGRES_PASSWORD psql -h $host_ip -p $POSTGRES_PORT -U $POSTGRES_USER -d $POSTGRES_DB -c "$SQL_COMMAND"'
 }
 
+# Function to execute a SQL file
+execute_sql_file() {
+    local sql_file=$(realpath "$1")
+    docker run --rm \
+        --env-file "$ENV_FILE" \
+        -e SQL_FILE="$(basename "$sql_file")" \
+        -e host_ip="$host_ip" \
+        -v "$(dirname "$sql_file")":/sql \
+        $DOCKER_IMAGE \
+        sh -c 'PGPASSWORD=$POSTGRES_PASSWORD psql -v ON_ERROR_STOP=1 -h $host_ip -p $POSTGRES_PORT -U $POSTGRES_USER -d $POSTGRES_DB -f "/sql/$SQL_FILE"'
+}
+
 # Define common variables
 ENV_FILE="../../.env"
 DOCKER_IMAGE="postgis:utils"  # You can also define this here if it's common across scripts
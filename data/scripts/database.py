@@ -0,0 +1,375 @@
+import logging
+import os
+import queue
+import random
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set
+
+import psycopg2
+from dotenv import load_dotenv
+from psycopg2.extensions import connection as Connection
+from psycopg2.extensions import cursor as Cursor
+from psycopg2.pool import ThreadedConnectionPool
+
+# The .env file lives in the repository root, two levels above data/scripts
+DEFAULT_DOTENV_PATH = Path(__file__).resolve().parents[2] / ".env"
+
+REQUIRED_ENV_VARS = ["POSTGRES_PORT", "POSTGRES_DB", "POSTGRES_USER", "POSTGRES_PASSWORD"]
+
+# Lines grouped into one queue item by copy_stream()
+COPY_STREAM_BATCH_LINES = 1000
+
+
+@dataclass(frozen=True)
+class DatabaseConfig:
+    host: str
+    port: int
+    database: str
+    user: str
+    password: str
+
+
+def load_config(dotenv_path: Path = DEFAULT_DOTENV_PATH) -> DatabaseConfig:
+    """
+    Load the database configuration from the .env file and the environment.
+
+    Variables already set in the environment take precedence over the .env file.
+
+    Args:
+        dotenv_path (Path, optional): Path to the .env file. Defaults to the repository root .env.
+
+    Raises:
+        EnvironmentError: If a required variable is missing or POSTGRES_PORT is not an integer.
+
+    Returns:
+        DatabaseConfig: The database connection settings.
+    """
+    if not load_dotenv(dotenv_path):
+        logging.warning(f"No .env file loaded from {dotenv_path}")
+
+    missing_vars = [var for var in REQUIRED_ENV_VARS if not os.getenv(var)]
+    if missing_vars:
+        raise EnvironmentError(
+            f"Missing required environment variables: {', '.join(missing_vars)}"
+        )
+
+    port = os.getenv("POSTGRES_PORT")
+    if not port.isdigit():
+        raise EnvironmentError(f"Invalid POSTGRES_PORT: {port}. Must be an integer.")
+
+    return DatabaseConfig(
+        host=os.getenv("POSTGRES_HOST", "localhost"),
+        port=int(port),
+        database=os.getenv("POSTGRES_DB"),
+        user=os.getenv("POSTGRES_USER"),
+        password=os.getenv("POSTGRES_PASSWORD"),
+    )
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """
+    Exponential backoff with full jitter.
+
+    Args:
+        attempt (int): Zero-based retry attempt.
+        base_delay (float): Delay cap of the first attempt in seconds.
+        max_delay (float): Upper bound of the delay cap in seconds.
+
+    Returns:
+        float: Seconds to wait before the next attempt.
+    """
+    return random.uniform(0, min(max_delay, base_delay * 2**attempt))
+
+
+class LineStream:
+    """
+    Read-only file object over an iterable of text lines.
+
+    Lines are pulled only as COPY reads, so data is streamed to the server
+    without being materialized in memory or on disk first.
+    """
+
+    def __init__(self, lines: Iterable[str]) -> None:
+        self._lines = iter(lines)
+        self._buffer = ""
+
+    def read(self, size: int = -1) -> str:
+        chunks = [self._buffer]
+        length = len(self._buffer)
+        for line in self._lines:
+            chunks.append(line)
+            length += len(line)
+            if 0 <= size <= length:
+                break
+        data = "".join(chunks)
+        if size < 0:
+            self._buffer = ""
+            return data
+        self._buffer = data[size:]
+        return data[:size]
+
+
+class CopyAborted(Exception):
+    """Raised inside COPY when the block feeding copy_stream() fails."""
+
+
+class Database:
+    """
+    Thread-safe pool of PostgreSQL connections shared by the data loaders.
+
+    Connections are handed out by connection(); callers block while all of
+    them are in use. All connections stay open between uses unless
+    min_connections is set lower than max_connections. Statements registered
+    with prepare() are created as server-side prepared statements lazily on
+    every pooled connection.
+    """
+
+    def __init__(
+        self,
+        config: DatabaseConfig,
+        max_connections: int = 4,
+        min_connections: Optional[int] = None,
+        retries: int = 5,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+    ) -> None:
+        self.config = config
+        self.retries = retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        if min_connections is None:
+            min_connections = max_connections
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._lock = threading.Lock()
+        self._statements: Dict[str, str] = {}
+        # Keyed by the connection object itself; entries go away with the connection,
+        # including the ones the pool closes on its own
+        self._prepared: "weakref.WeakKeyDictionary[Connection, Set[str]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._pool = self._with_retries(
+            lambda: ThreadedConnectionPool(
+                min_connections,
+                max_connections,
+                host=config.host,
+                port=config.port,
+                database=config.database,
+                user=config.user,
+                password=config.password,
+            )
+        )
+
+    def _with_retries(self, connect: Any) -> Any:
+        """
+        Call connect, retrying operational errors with exponential backoff and jitter.
+
+        Raises:
+            psycopg2.OperationalError: If the last attempt fails.
+        """
+        for attempt in range(self.retries):
+            try:
+                return connect()
+            except psycopg2.OperationalError as oe:
+                if attempt + 1 == self.retries:
+                    raise
+                delay = backoff_delay(attempt, self.base_delay, self.max_delay)
+                logging.warning(
+                    f"Attempt {attempt + 1} - Database connection failed: {oe}. "
+                    f"Retrying in {delay:.1f} seconds..."
+                )
+                time.sleep(delay)
+        raise psycopg2.OperationalError("Exceeded maximum retries for database connection.")
+
+    def close(self) -> None:
+        """Close every pooled connection."""
+        with self._lock:
+            self._pool.closeall()
+            self._prepared.clear()
+
+    def __enter__(self) -> "Database":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    @contextmanager
+    def connection(self) -> Iterator[Connection]:
+        """
+        Borrow a pooled connection; commit on success and roll back on error.
+
+        Broken connections are discarded instead of being returned to the pool.
+        """
+        with self._slots:
+            conn = self._with_retries(self._pool.getconn)
+            if conn.closed:
+                self._discard(conn)
+                conn = self._with_retries(self._pool.getconn)
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                if not conn.closed:
+                    conn.rollback()
+                raise
+            finally:
+                if conn.closed:
+                    self._discard(conn)
+                else:
+                    self._pool.putconn(conn)
+
+    def _discard(self, conn: Connection) -> None:
+        with self._lock:
+            self._prepared.pop(conn, None)
+        self._pool.putconn(conn, close=True)
+
+    @contextmanager
+    def cursor(self) -> Iterator[Cursor]:
+        """Borrow a cursor on a pooled connection, committed when the block exits."""
+        with self.connection() as conn, conn.cursor() as cur:
+            yield cur
+
+    def execute(self, sql: str, params: Optional[Sequence[Any]] = None) -> None:
+        """Execute a statement in its own transaction."""
+        with self.cursor() as cur:
+            cur.execute(sql, params)
+
+    def prepare(self, name: str, sql: str) -> None:
+        """
+        Register a statement to be run as a server-side prepared statement.
+
+        Args:
+            name (str): Statement name used by execute_prepared().
+            sql (str): Statement text with $1, $2, ... placeholders.
+        """
+        with self._lock:
+            self._statements[name] = sql
+
+    def _ensure_prepared(self, cur: Cursor, name: str) -> None:
+        with self._lock:
+            prepared = self._prepared.setdefault(cur.connection, set())
+            if name in prepared:
+                return
+            sql = self._statements[name]
+        cur.execute(f"PREPARE {name} AS {sql}")
+        with self._lock:
+            prepared.add(name)
+
+    def _execute_sql(self, name: str, arity: int) -> str:
+        placeholders = ", ".join(["%s"] * arity)
+        return f"EXECUTE {name} ({placeholders})" if arity else f"EXECUTE {name}"
+
+    def execute_prepared(self, name: str, params: Sequence[Any] = ()) -> int:
+        """
+        Execute a prepared statement once.
+
+        Returns:
+            int: Number of rows affected.
+        """
+        with self.cursor() as cur:
+            self._ensure_prepared(cur, name)
+            cur.execute(self._execute_sql(name, len(params)), params)
+            return cur.rowcount
+
+    def copy_file(
+        self, table: str, columns: List[str], file: IO, header: bool = False
+    ) -> None:
+        """
+        Bulk load a CSV file object into table with COPY.
+
+        Args:
+            table (str): Target table.
+            columns (List[str]): Target columns in file order.
+            file (IO): Open CSV file object.
+            header (bool, optional): Whether the first line is a header. Defaults to False.
+        """
+        copy_sql = (
+            f"COPY {table} ({', '.join(columns)}) FROM STDIN "
+            f"WITH (FORMAT csv, HEADER {'true' if header else 'false'})"
+        )
+        with self.cursor() as cur:
+            cur.copy_expert(copy_sql, file)
+
+    def copy_lines(self, table: str, columns: List[str], lines: Iterable[str]) -> None:
+        """
+        Stream CSV lines into table with COPY as they are produced.
+
+        Args:
+            table (str): Target table.
+            columns (List[str]): Target columns in line order.
+            lines (Iterable[str]): CSV lines, each ending with a newline.
+        """
+        self.copy_file(table, columns, LineStream(lines))
+
+    @contextmanager
+    def copy_stream(
+        self, table: str, columns: List[str], max_queued_batches: int = 64
+    ) -> Iterator[Callable[[str], None]]:
+        """
+        Stream the CSV lines written inside the block into table with COPY.
+
+        COPY runs in a background thread and reads the lines through a bounded
+        queue while they are being written. If the block raises, the COPY is
+        aborted and nothing is loaded.
+
+        Example:
+            with db.copy_stream("weather_observations_staging", columns) as write:
+                for line in lines:
+                    write(line)
+        """
+        batches: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=max_queued_batches)
+        aborted = threading.Event()
+        errors: List[BaseException] = []
+        pending: List[str] = []
+
+        def queued_batches() -> Iterator[str]:
+            while True:
+                batch = batches.get()
+                if batch is None:
+                    if aborted.is_set():
+                        raise CopyAborted(f"COPY into {table} aborted")
+                    return
+                yield batch
+
+        def run_copy() -> None:
+            try:
+                self.copy_lines(table, columns, queued_batches())
+            except BaseException as e:
+                errors.append(e)
+
+        def put(batch: Optional[str]) -> None:
+            # Stop waiting if COPY failed and no longer drains the queue
+            while True:
+                try:
+                    batches.put(batch, timeout=1)
+                    return
+                except queue.Full:
+                    if not copy_thread.is_alive():
+                        raise errors[0] if errors else CopyAborted(f"COPY into {table} stopped")
+
+        def write(line: str) -> None:
+            pending.append(line)
+            if len(pending) >= COPY_STREAM_BATCH_LINES:
+                put("".join(pending))
+                pending.clear()
+
+        copy_thread = threading.Thread(target=run_copy, name=f"copy-{table}", daemon=True)
+        copy_thread.start()
+        try:
+            yield write
+            if pending:
+                put("".join(pending))
+        except BaseException:
+            aborted.set()
+            if copy_thread.is_alive():
+                put(None)
+            copy_thread.join()
+            raise
+        put(None)
+        copy_thread.join()
+        if errors:
+            raise errors[0]
@@ -0,0 +1,119 @@
+#!/bin/bash
+
+# Source the shared functions and variables
+# Adjust the path to common.sh based on your directory structure
+source "$(dirname "$0")/common.sh"
+
+# Define variables
+CSV_FILE="input_files.csv"
+ZOOM_BANDS_FILE="zoom_bands.csv"
+SQL_FILE="../sql/generalized_geometries.sql"
+DATA_FOLDER=$(realpath "../src")  # Absolute path to data folder
+GDAL_DOCKER_IMAGE="osgeo/gdal:ubuntu-full-3.6.2"
+TIPPECANOE_DOCKER_IMAGE="tyemirov/tippecanoe"
+PYTHON_DOCKER_IMAGE="python:3.9-alpine"  # Use the official Python Docker image
+TILE_BYTE_BUDGET="${TILE_BYTE_BUDGET:-500000}"  # Tiles above this size are flagged in the report
+
+check_file_exists "$CSV_FILE"
+check_file_exists "$ZOOM_BANDS_FILE"
+check_file_exists "$SQL_FILE"
+check_folder_exists "$DATA_FOLDER"
+
+# Step 1: Install the zoom band table and the generalization functions
+echo "Installing generalization functions..."
+execute_sql_file "$SQL_FILE"
+echo "Generalization functions are ready."
+
+# Step 1a: Load the zoom bands
+echo "Loading zoom bands from $ZOOM_BANDS_FILE..."
+ZOOM_BAND_VALUES=$(tail -n +2 "$ZOOM_BANDS_FILE" | awk -F, 'NF == 3 { printf "%s(%s, %s, %s)", sep, $1, $2, $3; sep = ", " }')
+execute_sql "TRUNCATE TABLE geometry_zoom_bands; INSERT INTO geometry_zoom_bands (zoom_min, zoom_max, tolerance) VALUES $ZOOM_BAND_VALUES;"
+echo "Zoom bands loaded."
+
+# Step 2: Generalize every layer; pass table names as arguments to limit the run
+tail -n +2 "$CSV_FILE" | while IFS=, read -r zip_file table_name; do
+    # Trim possible whitespace
+    zip_file=$(echo "$zip_file" | xargs)
+    table_name=$(echo "$table_name" | xargs)
+
+    if [ "$#" -gt 0 ] && [[ ! " $* " =~ " $table_name " ]]; then
+        continue
+    fi
+
+    echo "Generalizing table: $table_name"
+
+    ZIP_BASENAME=$(basename "$zip_file" .zip)
+    BANDS_DIR="$DATA_FOLDER/${ZIP_BASENAME}_bands"
+    MBTILES="${ZIP_BASENAME}.mbtiles"
+    REPORT="${ZIP_BASENAME}.tile_sizes.csv"
+
+    # Step 2a: Build the simplified geometries per zoom band
+    echo "Building ${table_name}_generalized..."
+    execute_sql "SELECT public.build_generalized_geometries('$table_name');"
+    echo "Table '${table_name}_generalized' is ready."
+
+    # Step 2b: Create the zoom-aware tile function for pg_tileserv
+    echo "Creating tile function ${table_name}_tile..."
+    execute_sql "SELECT public.create_generalized_tile_function('$table_name');"
+    echo "Tile function 'public.${table_name}_tile' is ready."
+
+    mkdir -p "$BANDS_DIR"
+
+    # Step 2c: Tile each band only within its own zoom range
+    tail -n +2 "$ZOOM_BANDS_FILE" | while IFS=, read -r zoom_min zoom_max tolerance; do
+        zoom_min=$(echo "$zoom_min" | xargs)
+        zoom_max=$(echo "$zoom_max" | xargs)
+        tolerance=$(echo "$tolerance" | xargs)
+        BAND_GEOJSON="band_${zoom_min}_${zoom_max}.geojson"
+        BAND_MBTILES="band_${zoom_min}_${zoom_max}.mbtiles"
+
+        # Bands without simplification are read straight from the full-resolution table
+        if awk -v tolerance="$tolerance" 'BEGIN { exit !(tolerance == 0) }'; then
+            BAND_SQL="SELECT * FROM $table_name"
+        else
+            BAND_SQL="SELECT * FROM ${table_name}_generalized WHERE zoom_min = $zoom_min"
+        fi
+
+        echo "Exporting zoom band $zoom_min-$zoom_max to $BAND_GEOJSON..."
+        docker run --rm \
+            --env-file "$ENV_FILE" \
+            -e host_ip="$host_ip" \
+            -e BAND_SQL="$BAND_SQL" \
+            -e BAND_GEOJSON="$BAND_GEOJSON" \
+            -v "$BANDS_DIR":/data \
+            $GDAL_DOCKER_IMAGE \
+            sh -c 'ogr2ogr -f GeoJSON -t_srs EPSG:4326 "/data/$BAND_GEOJSON" PG:"host=$host_ip port=$POSTGRES_PORT dbname=$POSTGRES_DB user=$POSTGRES_USER password=$POSTGRES_PASSWORD" -sql "$BAND_SQL"'
+
+        # Geometries are already generalized for the band, so tippecanoe must not simplify
+        # or drop them; oversized tiles are reported instead.
+        echo "Converting $BAND_GEOJSON to $BAND_MBTILES using tippecanoe..."
+        docker run --rm --entrypoint "" -v "$BANDS_DIR":/data $TIPPECANOE_DOCKER_IMAGE \
+            tippecanoe -o "/data/$BAND_MBTILES" --force -Z "$zoom_min" -z "$zoom_max" \
+            --layer="$ZIP_BASENAME" --no-simplification --no-tiny-polygon-reduction --no-tile-size-limit \
+            -x zoom_min -x zoom_max "/data/$BAND_GEOJSON"
+    done
+
+    # Step 2d: Merge the bands into the layer's MBTiles
+    echo "Joining zoom bands into $MBTILES..."
+    docker run --rm --entrypoint "" -v "$DATA_FOLDER":/data $TIPPECANOE_DOCKER_IMAGE \
+        sh -c "tile-join -o '/data/$MBTILES' --force --no-tile-size-limit /data/${ZIP_BASENAME}_bands/*.mbtiles"
+    check_file_exists "$DATA_FOLDER/$MBTILES"
+    echo "MBTiles conversion successful: $MBTILES"
+
+    # Step 2e: Report tile sizes per zoom and flag tiles over budget
+    echo "Writing tile size report $REPORT..."
+    docker run --rm \
+        -v "$DATA_FOLDER":/data \
+        -v "$(pwd)/tile_size_report.py":/tile_size_report.py \
+        $PYTHON_DOCKER_IMAGE \
+        python /tile_size_report.py "/data/$MBTILES" "/data/$REPORT" --budget "$TILE_BYTE_BUDGET"
+
+    # Step 2f: Clean up the intermediate band files
+    echo "Cleaning up band files..."
+    rm -rf "$BANDS_DIR"
+
+    echo "Table '$table_name' generalized into '$MBTILES'."
+    echo "--------------------------------------------"
+done
+
+echo "All layers generalized successfully."
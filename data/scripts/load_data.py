@@ -0,0 +1,493 @@
+#!/usr/bin/env python3
+
+import argparse
+import gzip
+import logging
+import sys
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator
+
+from database import Database, load_config
+from parse_stations import parse_stations_file
+
+DATA_FOLDER = Path(__file__).resolve().parents[1]  # data/
+SRC_FOLDER = DATA_FOLDER / "src"
+
+# Weather stations
+
+CREATE_WEATHER_STATIONS_SQL = """
+CREATE TABLE IF NOT EXISTS weather_stations (
+    station_id VARCHAR(11) PRIMARY KEY,
+    latitude FLOAT,
+    longitude FLOAT,
+    elevation FLOAT,
+    state VARCHAR(2),
+    location_description VARCHAR(100),
+    distance FLOAT,
+    direction VARCHAR(3),
+    geom GEOMETRY(Point, 4326)
+);
+CREATE INDEX IF NOT EXISTS idx_weather_stations_geom ON weather_stations USING GIST (geom);
+CREATE UNLOGGED TABLE IF NOT EXISTS weather_stations_staging (
+    LIKE weather_stations EXCLUDING ALL
+);
+TRUNCATE TABLE weather_stations_staging;
+"""
+
+UPSERT_WEATHER_STATIONS_SQL = """
+INSERT INTO weather_stations (station_id, latitude, longitude, elevation, state, location_description, distance, direction, geom)
+SELECT station_id, latitude, longitude, elevation, state, location_description, distance, direction,
+    ST_SetSRID(ST_MakePoint(longitude, latitude), 4326)
+FROM weather_stations_staging
+ON CONFLICT (station_id)
+DO UPDATE SET
+    latitude = EXCLUDED.latitude,
+    longitude = EXCLUDED.longitude,
+    elevation = EXCLUDED.elevation,
+    state = EXCLUDED.state,
+    location_description = EXCLUDED.location_description,
+    distance = EXCLUDED.distance,
+    direction = EXCLUDED.direction,
+    geom = EXCLUDED.geom
+"""
+
+WEATHER_STATIONS_COLUMNS = [
+    "station_id",
+    "latitude",
+    "longitude",
+    "elevation",
+    "state",
+    "location_description",
+    "distance",
+    "direction",
+]
+
+# Weather observations
+
+CREATE_WEATHER_OBSERVATIONS_SQL = """
+DROP TABLE IF EXISTS weather_observations_staging;
+CREATE UNLOGGED TABLE weather_observations_staging (
+    station_id VARCHAR(20),
+    observation_date DATE,
+    observation_type VARCHAR(10),
+    value FLOAT,
+    flag VARCHAR(1),
+    time_of_observation VARCHAR(4),
+    line_number BIGINT GENERATED ALWAYS AS IDENTITY  -- COPY fills it in file order
+);
+CREATE TABLE IF NOT EXISTS weather_observations (
+    station_id VARCHAR(20),
+    observation_date DATE,
+    observation_type VARCHAR(10),
+    value FLOAT,
+    flag VARCHAR(1),
+    time_of_observation VARCHAR(4),
+    PRIMARY KEY (station_id, observation_date, observation_type)
+);
+"""
+
+UPSERT_WEATHER_OBSERVATIONS_SQL = """
+INSERT INTO weather_observations (station_id, observation_date, observation_type, value, flag, time_of_observation)
+SELECT DISTINCT ON (station_id, observation_date, observation_type)
+    station_id, observation_date, observation_type, value, flag, time_of_observation
+FROM weather_observations_staging
+ORDER BY station_id, observation_date, observation_type, line_number DESC  -- the last duplicate wins
+ON CONFLICT (station_id, observation_date, observation_type)
+DO UPDATE SET
+    value = EXCLUDED.value,
+    flag = EXCLUDED.flag,
+    time_of_observation = EXCLUDED.time_of_observation
+"""
+
+WEATHER_OBSERVATIONS_COLUMNS = [
+    "station_id",
+    "observation_date",
+    "observation_type",
+    "value",
+    "flag",
+    "time_of_observation",
+]
+
+# Denormalized weather observations
+
+CREATE_PIVOT_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS weather_observations_denormalized (
+    station_id VARCHAR(255) NOT NULL,
+    date DATE NOT NULL,
+    year INTEGER NOT NULL,
+    tmax NUMERIC,
+    tmin NUMERIC,
+    hmax NUMERIC,
+    hmin NUMERIC,
+    state VARCHAR(100),
+    county VARCHAR(255),
+    geom GEOMETRY(Point, 4326),
+    PRIMARY KEY (station_id, date)
+);
+TRUNCATE TABLE weather_observations_denormalized;
+"""
+
+UPSERT_PIVOT_SQL = """
+INSERT INTO weather_observations_denormalized
+(station_id, date, year, tmax, tmin, hmin, hmax, state, county, geom)
+SELECT
+    wo.station_id,
+    wo.observation_date,
+    EXTRACT(YEAR FROM wo.observation_date) AS year,
+    COALESCE(
+        MAX(CASE WHEN wo.observation_type = 'TMAX' THEN wo.value END),
+        MAX(CASE WHEN wo.observation_type = 'MXPN' THEN wo.value END),
+        MAX(CASE WHEN wo.observation_type = 'TOBS' THEN wo.value END),
+        MAX(CASE WHEN wo.observation_type = 'TAVG' THEN wo.value END)
+    ) AS tmax,
+    COALESCE(
+        MIN(CASE WHEN wo.observation_type = 'TMIN' THEN wo.value END),
+        MIN(CASE WHEN wo.observation_type = 'MNPN' THEN wo.value END),
+        MIN(CASE WHEN wo.observation_type = 'TOBS' THEN wo.value END),
+        MIN(CASE WHEN wo.observation_type = 'TAVG' THEN wo.value END)
+    ) AS tmin,
+    COALESCE(
+        MIN(CASE WHEN wo.observation_type = 'RHMN' THEN wo.value END),
+        MIN(CASE WHEN wo.observation_type = 'RHAV' THEN wo.value END)
+    ) AS hmin,
+    COALESCE(
+        MAX(CASE WHEN wo.observation_type = 'RHMX' THEN wo.value END),
+        MAX(CASE WHEN wo.observation_type = 'RHAV' THEN wo.value END)
+    ) AS hmax,
+    ws.state,
+    uc.namelsad AS county,
+    ws.geom
+FROM
+    weather_observations wo
+JOIN
+    weather_stations ws ON wo.station_id = ws.station_id
+JOIN
+    us_counties uc ON ST_Within(ws.geom, uc.geom)
+WHERE
+    wo.observation_type IN ('TMAX', 'TMIN', 'RHMN', 'RHMX', 'MXPN', 'MNPN', 'TOBS', 'TAVG', 'RHAV')
+GROUP BY
+    wo.station_id,
+    wo.observation_date,
+    ws.state,
+    uc.namelsad,
+    ws.geom
+ON CONFLICT (station_id, date)
+DO UPDATE SET
+    year = EXCLUDED.year,
+    tmax = EXCLUDED.tmax,
+    tmin = EXCLUDED.tmin,
+    hmin = EXCLUDED.hmin,
+    hmax = EXCLUDED.hmax,
+    state = EXCLUDED.state,
+    county = EXCLUDED.county,
+    geom = EXCLUDED.geom
+"""
+
+CREATE_PIVOT_INDICES_SQL = """
+CREATE INDEX IF NOT EXISTS idx_weather_geom ON weather_observations_denormalized USING GIST (geom);
+CREATE INDEX IF NOT EXISTS idx_weather_temp_date ON weather_observations_denormalized (tmin, tmax, date);
+CREATE INDEX IF NOT EXISTS idx_weather_station_state_county_geom ON weather_observations_denormalized (station_id, state, county, year);
+CREATE INDEX IF NOT EXISTS idx_weather_temp_geom ON weather_observations_denormalized (tmin, tmax, geom);
+CREATE INDEX IF NOT EXISTS idx_weather_temp_year ON weather_observations_denormalized (tmin, tmax, year);
+"""
+
+# ZIP codes
+
+CREATE_ZIP_CODES_SQL = """
+DROP TABLE IF EXISTS us_zip_codes_data;
+CREATE TABLE us_zip_codes_data (
+    id SERIAL PRIMARY KEY,
+    area_name VARCHAR(100),
+    area_code VARCHAR(10),
+    district_name VARCHAR(100),
+    district_no VARCHAR(10),
+    delivery_zipcode VARCHAR(10),
+    locale_name VARCHAR(100),
+    physical_delv_addr VARCHAR(200),
+    physical_city VARCHAR(100),
+    physical_state VARCHAR(2),
+    physical_zip VARCHAR(10),
+    physical_zip4 VARCHAR(10)
+);
+"""
+
+ZIP_CODES_COLUMNS = [
+    "area_name",
+    "area_code",
+    "district_name",
+    "district_no",
+    "delivery_zipcode",
+    "locale_name",
+    "physical_delv_addr",
+    "physical_city",
+    "physical_state",
+    "physical_zip",
+    "physical_zip4",
+]
+
+# Sales taxes
+
+CREATE_SALES_TAXES_SQL = """
+DROP TABLE IF EXISTS sales_taxes;
+CREATE TABLE sales_taxes (
+    id SERIAL PRIMARY KEY,
+    state VARCHAR(2) NOT NULL,
+    zipcode VARCHAR(5) NOT NULL,
+    tax_region_name VARCHAR(255),
+    estimated_combined_rate FLOAT,
+    state_rate FLOAT,
+    estimated_county_rate FLOAT,
+    estimated_city_rate FLOAT,
+    estimated_special_rate FLOAT,
+    risk_level INTEGER,
+    geom GEOMETRY(MultiPolygon, 4326),
+    CONSTRAINT sales_taxes_unique UNIQUE (zipcode, tax_region_name)
+);
+CREATE INDEX IF NOT EXISTS idx_sales_taxes_zipcode ON sales_taxes(zipcode);
+CREATE INDEX IF NOT EXISTS idx_sales_taxes_tax_region_name ON sales_taxes(tax_region_name);
+CREATE INDEX IF NOT EXISTS idx_sales_taxes_geom ON sales_taxes USING GIST (geom);
+DROP TABLE IF EXISTS sales_taxes_staging;
+CREATE UNLOGGED TABLE sales_taxes_staging (
+    state VARCHAR(2),
+    zipcode VARCHAR(5),
+    tax_region_name VARCHAR(255),
+    estimated_combined_rate FLOAT,
+    state_rate FLOAT,
+    estimated_county_rate FLOAT,
+    estimated_city_rate FLOAT,
+    estimated_special_rate FLOAT,
+    risk_level INTEGER,
+    line_number BIGINT GENERATED ALWAYS AS IDENTITY  -- COPY fills it in file order
+);
+"""
+
+UPSERT_SALES_TAXES_SQL = """
+INSERT INTO sales_taxes (
+    state, zipcode, tax_region_name, estimated_combined_rate,
+    state_rate, estimated_county_rate, estimated_city_rate,
+    estimated_special_rate, risk_level
+)
+SELECT DISTINCT ON (zipcode, tax_region_name)
+    state, zipcode, tax_region_name, estimated_combined_rate,
+    state_rate, estimated_county_rate, estimated_city_rate,
+    estimated_special_rate, risk_level
+FROM sales_taxes_staging
+ORDER BY zipcode, tax_region_name, line_number DESC  -- the last duplicate wins
+ON CONFLICT (zipcode, tax_region_name)
+DO UPDATE SET
+    state = EXCLUDED.state,
+    estimated_combined_rate = EXCLUDED.estimated_combined_rate,
+    state_rate = EXCLUDED.state_rate,
+    estimated_county_rate = EXCLUDED.estimated_county_rate,
+    estimated_city_rate = EXCLUDED.estimated_city_rate,
+    estimated_special_rate = EXCLUDED.estimated_special_rate,
+    risk_level = EXCLUDED.risk_level
+"""
+
+ADD_SALES_TAXES_GEOM_SQL = """
+UPDATE sales_taxes mt
+SET geom = uz.geom
+FROM us_zipcode uz
+WHERE mt.zipcode = uz.zcta5ce20;
+"""
+
+SALES_TAXES_COLUMNS = [
+    "state",
+    "zipcode",
+    "tax_region_name",
+    "estimated_combined_rate",
+    "state_rate",
+    "estimated_county_rate",
+    "estimated_city_rate",
+    "estimated_special_rate",
+    "risk_level",
+]
+
+
+def load_weather_stations(db: Database) -> None:
+    """
+    Parse ghcnd-stations.txt and upsert the U.S. stations into weather_stations.
+
+    Args:
+        db (Database): Shared database connection pool.
+    """
+    stations_file = SRC_FOLDER / "ghcnd-stations.txt"
+    if not stations_file.exists():
+        raise FileNotFoundError(f"Stations file '{stations_file}' does not exist.")
+
+    print("Creating weather_stations tables if not exist...")
+    db.execute(CREATE_WEATHER_STATIONS_SQL)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        csv_file = Path(tmp_dir) / "ghcnd-stations.csv"
+        parse_stations_file(stations_file, csv_file)
+
+        print("Loading stations into staging table...")
+        with open(csv_file, newline="") as f:
+            db.copy_file("weather_stations_staging", WEATHER_STATIONS_COLUMNS, f)
+
+    print("Performing upsert into weather_stations...")
+    db.execute_prepared("upsert_weather_stations")
+    db.execute("TRUNCATE TABLE weather_stations_staging;")
+    print("Weather stations loaded.")
+
+
+def us_observation_lines(lines: Iterable[str]) -> Iterator[str]:
+    """
+    Yield the first six columns of the U.S. rows of a GHCN-Daily CSV file.
+
+    Args:
+        lines (Iterable[str]): Lines of the CSV file.
+
+    Returns:
+        Iterator[str]: Filtered CSV lines, the same as `grep -i "^us" | cut -d, -f1-6`.
+    """
+    for line in lines:
+        if line[:2].lower() == "us":
+            yield ",".join(line.rstrip("\r\n").split(",", 6)[:6]) + "\n"
+
+
+def load_weather_data(db: Database) -> None:
+    """
+    Load the U.S. rows of every ../src/*.csv.gz GHCN-Daily file into weather_observations.
+
+    Args:
+        db (Database): Shared database connection pool.
+    """
+    if not SRC_FOLDER.is_dir():
+        raise FileNotFoundError(f"Data folder '{SRC_FOLDER}' does not exist.")
+
+    print("Creating weather_observations tables if not exist...")
+    db.execute(CREATE_WEATHER_OBSERVATIONS_SQL)
+
+    data_files = sorted(SRC_FOLDER.glob("*.csv.gz"))
+    if not data_files:
+        print(f"No .csv.gz files found in {SRC_FOLDER}.")
+
+    for data_file in data_files:
+        print(f"Processing file: {data_file}")
+        with gzip.open(data_file, "rt", newline="") as f, db.copy_stream(
+            "weather_observations_staging", WEATHER_OBSERVATIONS_COLUMNS
+        ) as write:
+            for line in us_observation_lines(f):
+                write(line)
+
+        db.execute_prepared("upsert_weather_observations")
+        db.execute("TRUNCATE TABLE weather_observations_staging;")
+        print(f"Finished processing file: {data_file}")
+
+    print("All weather files have been processed successfully.")
+
+
+def denormalize_weather_data(db: Database) -> None:
+    """
+    Rebuild weather_observations_denormalized from observations, stations and counties.
+
+    Args:
+        db (Database): Shared database connection pool.
+    """
+    print("Creating pivot table if not exists...")
+    db.execute(CREATE_PIVOT_TABLE_SQL)
+
+    print("Inserting or updating data into the pivot table...")
+    db.execute(UPSERT_PIVOT_SQL)
+
+    print("Creating indexes on the pivot table...")
+    db.execute(CREATE_PIVOT_INDICES_SQL)
+    print("Pivot table 'weather_observations_denormalized' is ready.")
+
+
+def load_zip_codes(db: Database) -> None:
+    """
+    Convert ZIP_Locale_Detail.xls to CSV and load it into us_zip_codes_data.
+
+    Args:
+        db (Database): Shared database connection pool.
+    """
+    # pandas is only needed by this step
+    from convert_xls_to_csv import convert_xls_to_csv
+
+    xls_file = SRC_FOLDER / "ZIP_Locale_Detail.xls"
+    csv_file = DATA_FOLDER / "us_zip_codes.csv"
+    if not xls_file.exists():
+        raise FileNotFoundError(f"XLS file '{xls_file}' does not exist.")
+
+    print("Converting XLS to CSV...")
+    convert_xls_to_csv(xls_file, csv_file)
+
+    print("Creating table 'us_zip_codes_data'...")
+    db.execute(CREATE_ZIP_CODES_SQL)
+
+    print("Loading data into the database...")
+    with open(csv_file, newline="") as f:
+        db.copy_file("us_zip_codes_data", ZIP_CODES_COLUMNS, f, header=True)
+    print("ZIP codes loaded.")
+
+
+def load_sales_taxes(db: Database) -> None:
+    """
+    Load every ../src/TAXRATES_ZIP5/*.csv file into sales_taxes and attach ZCTA geometries.
+
+    Args:
+        db (Database): Shared database connection pool.
+    """
+    tax_folder = SRC_FOLDER / "TAXRATES_ZIP5"
+    if not tax_folder.is_dir():
+        raise FileNotFoundError(f"Data folder '{tax_folder}' does not exist.")
+
+    print("Creating sales_taxes tables...")
+    db.execute(CREATE_SALES_TAXES_SQL)
+
+    for csv_file in sorted(tax_folder.glob("*.csv")):
+        print(f"Processing file: {csv_file}")
+        with open(csv_file, newline="") as f:
+            db.copy_file("sales_taxes_staging", SALES_TAXES_COLUMNS, f, header=True)
+
+        db.execute_prepared("upsert_sales_taxes")
+        db.execute("TRUNCATE TABLE sales_taxes_staging;")
+        print(f"Finished processing file: {csv_file}")
+
+    print("Adding geometry to main table...")
+    db.execute(ADD_SALES_TAXES_GEOM_SQL)
+    print("Sales taxes data upload completed.")
+
+
+STEPS: Dict[str, Callable[[Database], None]] = {
+    "weather-stations": load_weather_stations,
+    "weather-data": load_weather_data,
+    "denormalize-weather-data": denormalize_weather_data,
+    "zip-codes": load_zip_codes,
+    "sales-taxes": load_sales_taxes,
+}
+
+
+def main() -> None:
+    """
+    Run the requested load steps in order over one shared connection pool.
+    """
+    parser = argparse.ArgumentParser(description="Load source data into PostGIS.")
+    parser.add_argument("steps", nargs="+", choices=list(STEPS), help="Steps to run, in order.")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING, format="%(asctime)s %(levelname)s: %(message)s")
+
+    with Database(load_config()) as db:
+        db.prepare("upsert_weather_stations", UPSERT_WEATHER_STATIONS_SQL)
+        db.prepare("upsert_weather_observations", UPSERT_WEATHER_OBSERVATIONS_SQL)
+        db.prepare("upsert_sales_taxes", UPSERT_SALES_TAXES_SQL)
+
+        for step in args.steps:
+            print(f"Running step: {step}")
+            STEPS[step](db)
+            print("-------------------------------------------")
+
+    print("All steps completed successfully.")
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except (FileNotFoundError, EnvironmentError) as e:
+        print(f"Error: {e}")
+        sys.exit(1)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+
+import argparse
+import csv
+import os
+import sqlite3
+import sys
+
+# Matches tippecanoe's default per-tile limit
+DEFAULT_TILE_BYTE_BUDGET = 500_000
+
+
+def collect_tile_sizes(mbtiles_file):
+    """Return (zoom, x, y, bytes) for every tile in the MBTiles file, using XYZ tile rows."""
+    with sqlite3.connect(mbtiles_file) as conn:
+        rows = conn.execute(
+            "SELECT zoom_level, tile_column, tile_row, length(tile_data) FROM tiles"
+        ).fetchall()
+
+    # MBTiles stores TMS rows; flip them so they match the {z}/{x}/{y} URLs
+    return [(z, x, (1 << z) - 1 - tms_y, size) for z, x, tms_y, size in rows]
+
+
+def write_tile_size_report(mbtiles_file, report_file, budget):
+    """
+    Write per-zoom tile size statistics to report_file and the tiles exceeding
+    budget to a sibling *.oversized.csv file.
+
+    Returns the number of tiles over budget.
+    """
+    tiles = collect_tile_sizes(mbtiles_file)
+
+    stats = {}
+    for z, _, _, size in tiles:
+        zoom_stats = stats.setdefault(
+            z, {"count": 0, "total": 0, "min": size, "max": size, "over": 0}
+        )
+        zoom_stats["count"] += 1
+        zoom_stats["total"] += size
+        zoom_stats["min"] = min(zoom_stats["min"], size)
+        zoom_stats["max"] = max(zoom_stats["max"], size)
+        if size > budget:
+            zoom_stats["over"] += 1
+
+    with open(report_file, "w", newline="") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(
+            [
+                "zoom",
+                "tile_count",
+                "total_bytes",
+                "min_bytes",
+                "avg_bytes",
+                "max_bytes",
+                "budget_bytes",
+                "tiles_over_budget",
+            ]
+        )
+        for z in sorted(stats):
+            zoom_stats = stats[z]
+            writer.writerow(
+                [
+                    z,
+                    zoom_stats["count"],
+                    zoom_stats["total"],
+                    zoom_stats["min"],
+                    zoom_stats["total"] // zoom_stats["count"],
+                    zoom_stats["max"],
+                    budget,
+                    zoom_stats["over"],
+                ]
+            )
+
+    oversized = sorted(
+        (tile for tile in tiles if tile[3] > budget), key=lambda tile: -tile[3]
+    )
+    oversized_file = os.path.splitext(report_file)[0] + ".oversized.csv"
+    with open(oversized_file, "w", newline="") as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(["zoom", "x", "y", "bytes"])
+        writer.writerows(oversized)
+
+    for z, x, y, size in oversized:
+        print(f"Warning: tile {z}/{x}/{y} is {size} bytes (budget {budget} bytes).")
+
+    return len(oversized)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Report MBTiles tile sizes per zoom and flag tiles over a byte budget."
+    )
+    parser.add_argument("mbtiles_file")
+    parser.add_argument("report_file")
+    parser.add_argument(
+        "--budget",
+        type=int,
+        default=int(os.getenv("TILE_BYTE_BUDGET", DEFAULT_TILE_BYTE_BUDGET)),
+        help="Maximum tile size in bytes (default: $TILE_BYTE_BUDGET or 500000).",
+    )
+    args = parser.parse_args()
+
+    if not os.path.exists(args.mbtiles_file):
+        print(f"Error: MBTiles file '{args.mbtiles_file}' does not exist.")
+        sys.exit(1)
+
+    over_budget = write_tile_size_report(args.mbtiles_file, args.report_file, args.budget)
+    print(
+        f"Tile size report generated at '{args.report_file}' "
+        f"({over_budget} tiles over {args.budget} bytes)."
+    )
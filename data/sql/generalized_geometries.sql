@@ -0,0 +1,186 @@
+-- Zoom bands used to generalize polygon layers for vector tiles.
+-- Rows are loaded from data/scripts/zoom_bands.csv by generalize_geometries.sh.
+-- tolerance is expressed in Web Mercator (SRID 3857) meters; bands with tolerance 0
+-- are served straight from the full-resolution source table.
+CREATE TABLE IF NOT EXISTS geometry_zoom_bands (
+    zoom_min INTEGER PRIMARY KEY,
+    zoom_max INTEGER NOT NULL,
+    tolerance FLOAT NOT NULL,
+    CHECK (zoom_min <= zoom_max),
+    CHECK (tolerance >= 0)
+);
+
+-- Transform a SRID 4326 geometry to Web Mercator (SRID 3857).
+-- Only features reaching past the Mercator latitude limit (polar rings cannot be projected)
+-- are clipped; everything else skips the overlay.
+CREATE OR REPLACE FUNCTION public.to_web_mercator(geom geometry)
+RETURNS geometry AS $$
+    SELECT ST_Transform(
+        CASE
+            WHEN ST_YMin(geom) < -85.06 OR ST_YMax(geom) > 85.06 THEN
+                ST_CollectionExtract(
+                    ST_Intersection(geom, ST_MakeEnvelope(-180, -85.06, 180, 85.06, 4326)),
+                    3
+                )
+            ELSE geom
+        END,
+        3857
+    );
+$$ LANGUAGE sql
+IMMUTABLE
+PARALLEL SAFE;
+
+-- Build <source_table>_generalized holding one simplified copy of every feature per
+-- zoom band with a non-zero tolerance.
+-- ST_CoverageSimplify keeps the edges shared by neighbouring polygons (counties, ZCTAs, ...)
+-- identical, so simplified layers do not open gaps or overlaps between features.
+CREATE OR REPLACE FUNCTION public.build_generalized_geometries(source_table text)
+RETURNS void AS $$
+DECLARE
+    target_table text := source_table || '_generalized';
+    source_columns text;
+BEGIN
+    -- All attribute columns of the source table, carried over as-is
+    SELECT string_agg(format('%I', column_name), ', ' ORDER BY ordinal_position)
+    INTO source_columns
+    FROM information_schema.columns
+    WHERE table_schema = 'public'
+      AND table_name = source_table
+      AND column_name <> 'geom';
+
+    IF source_columns IS NULL THEN
+        RAISE EXCEPTION 'table public.% does not exist', source_table;
+    END IF;
+
+    IF NOT EXISTS (SELECT 1 FROM geometry_zoom_bands) THEN
+        RAISE EXCEPTION 'geometry_zoom_bands is empty';
+    END IF;
+
+    EXECUTE format('DROP TABLE IF EXISTS %I', target_table);
+
+    EXECUTE format($sql$
+        CREATE TABLE %1$I AS
+        WITH
+        source_3857 AS (
+            SELECT %2$s, public.to_web_mercator(geom) AS geom
+            FROM %3$I
+        ),
+        -- Simplify every band as a single coverage
+        simplified AS (
+            SELECT s.*,
+                b.zoom_min,
+                b.zoom_max,
+                ST_CoverageSimplify(s.geom, b.tolerance) OVER (PARTITION BY b.zoom_min) AS band_geom
+            FROM source_3857 s
+            CROSS JOIN geometry_zoom_bands b
+            WHERE b.tolerance > 0
+              AND NOT ST_IsEmpty(s.geom)
+        )
+        SELECT %2$s,
+            zoom_min,
+            zoom_max,
+            ST_Multi(ST_CollectionExtract(band_geom, 3))::geometry(MultiPolygon, 3857) AS geom
+        FROM simplified
+        WHERE band_geom IS NOT NULL
+          AND NOT ST_IsEmpty(band_geom)
+    $sql$, target_table, source_columns, source_table);
+
+    EXECUTE format('CREATE INDEX %I ON %I USING GIST (geom)',
+        'idx_' || target_table || '_geom', target_table);
+    EXECUTE format('CREATE INDEX %I ON %I (zoom_min, zoom_max)',
+        'idx_' || target_table || '_zoom', target_table);
+    EXECUTE format('ANALYZE %I', target_table);
+END;
+$$ LANGUAGE plpgsql;
+
+-- Create public.<source_table>_tile(z, x, y) for pg_tileserv.
+-- The function serves the band covering z; zooms past the last band reuse the most detailed one.
+-- The zoom bands current at creation time are written into the function body, so reloading
+-- geometry_zoom_bands for other layers does not change which table this layer is served from.
+CREATE OR REPLACE FUNCTION public.create_generalized_tile_function(source_table text)
+RETURNS void AS $$
+DECLARE
+    target_table text := source_table || '_generalized';
+    source_columns text;
+    max_zoom integer;
+    full_resolution_zooms text;
+BEGIN
+    SELECT string_agg(format('g.%I', column_name), ', ' ORDER BY ordinal_position)
+    INTO source_columns
+    FROM information_schema.columns
+    WHERE table_schema = 'public'
+      AND table_name = target_table
+      AND column_name NOT IN ('geom', 'zoom_min', 'zoom_max');
+
+    IF source_columns IS NULL THEN
+        RAISE EXCEPTION 'table public.% does not exist', target_table;
+    END IF;
+
+    SELECT MAX(zoom_max) INTO max_zoom FROM geometry_zoom_bands;
+
+    IF max_zoom IS NULL THEN
+        RAISE EXCEPTION 'geometry_zoom_bands is empty';
+    END IF;
+
+    SELECT COALESCE(
+        string_agg(format('band_zoom BETWEEN %s AND %s', zoom_min, zoom_max), ' OR ' ORDER BY zoom_min),
+        'false'
+    )
+    INTO full_resolution_zooms
+    FROM geometry_zoom_bands
+    WHERE tolerance = 0;
+
+    EXECUTE format($sql$
+        CREATE OR REPLACE FUNCTION public.%1$I(
+            z integer,
+            x integer,
+            y integer
+        )
+        RETURNS bytea AS $fn$
+        DECLARE
+            zp integer := pow(2, z);
+            band_zoom integer := LEAST(z, %5$s);
+            result bytea;
+        BEGIN
+            IF y >= zp OR y < 0 OR x >= zp OR x < 0 THEN
+                RAISE EXCEPTION 'invalid tile coordinate (%%, %%, %%)', z, x, y;
+            END IF;
+
+            IF %6$s THEN
+                WITH
+                bounds AS (
+                    SELECT ST_TileEnvelope(z, x, y) AS geom
+                ),
+                mvtgeom AS (
+                    SELECT ST_AsMVTGeom(public.to_web_mercator(g.geom), b.geom) AS geom, %2$s
+                    FROM %3$I g, bounds b
+                    WHERE g.geom && ST_Transform(b.geom, 4326)
+                )
+                SELECT ST_AsMVT(mvtgeom, %3$L)
+                INTO result
+                FROM mvtgeom;
+            ELSE
+                WITH
+                bounds AS (
+                    SELECT ST_TileEnvelope(z, x, y) AS geom
+                ),
+                mvtgeom AS (
+                    SELECT ST_AsMVTGeom(g.geom, b.geom) AS geom, %2$s
+                    FROM %4$I g, bounds b
+                    WHERE band_zoom BETWEEN g.zoom_min AND g.zoom_max
+                      AND g.geom && b.geom
+                )
+                SELECT ST_AsMVT(mvtgeom, %3$L)
+                INTO result
+                FROM mvtgeom;
+            END IF;
+
+            RETURN result;
+        END;
+        $fn$ LANGUAGE plpgsql
+        STABLE
+        PARALLEL SAFE;
+    $sql$, source_table || '_tile', source_columns, source_table, target_table,
+        max_zoom, full_resolution_zooms);
+END;
+$$ LANGUAGE plpgsql;